@@ -15,11 +15,11 @@ fi
 
 if command -v uv >/dev/null 2>&1; then
   echo "[setup] installing Python packages with uv"
-  uv pip install --system pypdf pdfplumber reportlab
+  uv pip install --system pypdf pdfplumber pymupdf reportlab
 else
   echo "[setup] installing Python packages with pip"
   python3 -m pip install --upgrade pip
-  python3 -m pip install pypdf pdfplumber reportlab
+  python3 -m pip install pypdf pdfplumber pymupdf reportlab
 fi
 
 if command -v codex >/dev/null 2>&1; then
@@ -4,13 +4,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Sequence, Set
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Set
 
 try:
     from pypdf import PdfReader, PdfWriter  # type: ignore
@@ -23,7 +29,23 @@ try:
 except Exception:
     pdfplumber = None
 
+try:
+    import pymupdf  # type: ignore
+except Exception:
+    try:
+        import fitz as pymupdf  # type: ignore
+    except Exception:
+        pymupdf = None
+
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None
+
 INVALID_FILENAME_CHARS = re.compile(r"[\\/:*?\"<>|]")
+MAX_DEFAULT_WORKERS = 4
+PARALLEL_PAGE_THRESHOLD = 50
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def parse_args() -> argparse.Namespace:
@@ -89,6 +111,21 @@ def parse_args() -> argparse.Namespace:
             "'content' extracts PDF text."
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the extracted text cache under --tmp-dir",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS),
+        help=(
+            "Maximum number of concurrent worker processes for content-mode text extraction, "
+            "split merges and Ghostscript compression attempts "
+            f"(default: CPU count, capped at {MAX_DEFAULT_WORKERS})"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -122,92 +159,273 @@ def safe_output_name(name: str) -> str:
     return cleaned if cleaned.lower().endswith(".pdf") else f"{cleaned}.pdf"
 
 
+def extract_text_with_pymupdf(pdf_path: Path) -> str:
+    if pymupdf is None:
+        return ""
+    with pymupdf.open(str(pdf_path)) as doc:
+        return "\n".join(page.get_text("text") for page in doc)
+
+
+def page_ranges(page_count: int, range_count: int) -> List[range]:
+    size = -(-page_count // range_count)
+    return [range(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def _extract_pypdf_pages(pdf_path: str, pages: range) -> List[str]:
+    reader = PdfReader(pdf_path)
+    return [reader.pages[index].extract_text() or "" for index in pages]
+
+
+def extract_pypdf_pages_in_parallel(pdf_path: Path, page_count: int, workers: int) -> List[str]:
+    # pypdf is pure Python, so page ranges go to separate processes rather than
+    # threads. Each worker gets only the path and its page indices and opens its
+    # own reader. With a budget of one worker the ranges run inline.
+    ranges = page_ranges(page_count, max(workers, 1))
+    if len(ranges) == 1:
+        return _extract_pypdf_pages(str(pdf_path), ranges[0])
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        results = executor.map(_extract_pypdf_pages, repeat(str(pdf_path)), ranges)
+        return [text for texts in results for text in texts]
+
+
+def pdfplumber_page_text(page: Any) -> str:
+    try:
+        return page.extract_text() or ""
+    finally:
+        # Release the page's parsed objects so long documents do not pile them up.
+        page.close()
+
+
 def extract_text_with_pdfplumber(pdf_path: Path) -> str:
     if pdfplumber is None:
         return ""
-    chunks: List[str] = []
     with pdfplumber.open(str(pdf_path)) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            if text:
-                chunks.append(text)
-    return "\n".join(chunks)
+        return "\n".join(text for text in map(pdfplumber_page_text, pdf.pages) if text)
 
 
-def extract_text_with_pypdf(pdf_path: Path) -> str:
+def extract_text_with_pypdf(pdf_path: Path, workers: int = 1) -> str:
     if PdfReader is None:
         return ""
-    chunks: List[str] = []
     reader = PdfReader(str(pdf_path))
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        if text:
-            chunks.append(text)
-    return "\n".join(chunks)
+    page_count = len(reader.pages)
+    if page_count < PARALLEL_PAGE_THRESHOLD:
+        texts = [page.extract_text() or "" for page in reader.pages]
+    else:
+        texts = extract_pypdf_pages_in_parallel(pdf_path, page_count, workers)
+    return "\n".join(text for text in texts if text)
 
 
-def extract_text_with_gs(pdf_path: Path, tmp_dir: Path) -> str:
+def extract_text_with_gs(pdf_path: Path) -> str:
     gs_path = shutil.which("gs")
     if not gs_path:
         return ""
 
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        mode="w+",
-        suffix=".txt",
-        prefix="gs_text_",
-        dir=str(tmp_dir),
-        delete=False,
-        encoding="utf-8",
-    ) as tf:
-        txt_path = Path(tf.name)
-
     cmd = [
         gs_path,
         "-q",
         "-dNOPAUSE",
         "-dBATCH",
         "-sDEVICE=txtwrite",
-        f"-sOutputFile={txt_path}",
+        "-sOutputFile=-",
         str(pdf_path),
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True)
     if result.returncode != 0:
-        txt_path.unlink(missing_ok=True)
         return ""
+    return result.stdout.decode("utf-8", errors="ignore")
 
-    try:
-        return txt_path.read_text(encoding="utf-8", errors="ignore")
-    finally:
-        txt_path.unlink(missing_ok=True)
 
+def text_cache_path(pdf_path: Path, tmp_dir: Path) -> Path:
+    # A stat-based key avoids reading the whole PDF just to decide it is cached.
+    # The source name is hashed so long (e.g. Korean, 3 bytes/char) names cannot
+    # push the entry past the filesystem's file name length limit.
+    st = pdf_path.stat()
+    name_key = hashlib.blake2b(pdf_path.name.encode("utf-8"), digest_size=8).hexdigest()
+    key = f"{st.st_size}_{st.st_mtime_ns}_{st.st_ino}_{name_key}"
+    return tmp_dir / "text_cache" / f"{key}.txt"
 
-def extract_text(pdf_path: Path, tmp_dir: Path) -> str:
+
+def extract_text(
+    pdf_path: Path, tmp_dir: Path, use_cache: bool = True, workers: int = 1
+) -> str:
+    if not use_cache:
+        return extract_text_uncached(pdf_path, workers)
+
+    # The cache is only an optimisation: any cache I/O error falls back to, or
+    # keeps, the freshly extracted text instead of failing the PDF.
+    cache_path = text_cache_path(pdf_path, tmp_dir)
+    try:
+        if cache_path.is_file():
+            return cache_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeError):
+        pass
+
+    text = extract_text_uncached(pdf_path, workers)
+    if not text.strip():
+        # No extractor found text; do not cache that, so installing a backend
+        # (e.g. PyMuPDF or gs) later is picked up without --no-cache.
+        return text
+    # Write then rename so concurrent workers never read a partial entry.
+    partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.part")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path.write_text(text, encoding="utf-8")
+        os.replace(partial_path, cache_path)
+    except (OSError, UnicodeError):
+        try:
+            partial_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return text
+
+
+def extract_text_uncached(pdf_path: Path, workers: int = 1) -> str:
+    text = extract_text_with_pymupdf(pdf_path)
+    if text.strip():
+        return text
     text = extract_text_with_pdfplumber(pdf_path)
     if text.strip():
         return text
-    text = extract_text_with_pypdf(pdf_path)
+    text = extract_text_with_pypdf(pdf_path, workers)
     if text.strip():
         return text
-    return extract_text_with_gs(pdf_path, tmp_dir)
+    return extract_text_with_gs(pdf_path)
+
+
+def _extract_text_worker(pdf_path: str, tmp_dir: str, use_cache: bool) -> str:
+    # Already one of --workers processes, so pages are never split further here.
+    return extract_text(Path(pdf_path), Path(tmp_dir), use_cache, workers=1)
+
+
+def extract_texts(
+    pdf_paths: Sequence[Path], tmp_dir: Path, workers: int, use_cache: bool = True
+) -> Dict[Path, str]:
+    extracted_text: Dict[Path, str] = {}
+    if workers <= 1 or len(pdf_paths) <= 1:
+        # No per-file pool: the whole worker budget is left for page ranges.
+        for pdf_path in pdf_paths:
+            try:
+                extracted_text[pdf_path] = extract_text(pdf_path, tmp_dir, use_cache, workers)
+            except Exception as exc:
+                print(f"[WARN] Failed to read {pdf_path}: {exc}")
+                extracted_text[pdf_path] = ""
+        return extracted_text
+
+    # Only plain strings cross the process boundary to keep pickling cheap.
+    with ProcessPoolExecutor(max_workers=min(workers, len(pdf_paths))) as executor:
+        futures = {
+            executor.submit(
+                _extract_text_worker, str(pdf_path), str(tmp_dir), use_cache
+            ): pdf_path
+            for pdf_path in pdf_paths
+        }
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                extracted_text[pdf_path] = future.result()
+            except Exception as exc:
+                print(f"[WARN] Failed to read {pdf_path}: {exc}")
+                extracted_text[pdf_path] = ""
+    return extracted_text
+
+
+def iter_pdf_entries(directory: str, recursive: bool) -> Iterator[str]:
+    # DirEntry caches the file type from readdir, so most entries need no extra stat.
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(".pdf") and entry.is_file():
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    yield from iter_pdf_entries(entry.path, recursive)
+    except PermissionError:
+        return
 
 
 def list_pdfs(input_dir: Path, recursive: bool) -> List[Path]:
-    files = input_dir.rglob("*.pdf") if recursive else input_dir.glob("*.pdf")
-    return sorted(path for path in files if path.is_file())
+    return sorted(Path(path) for path in iter_pdf_entries(str(input_dir), recursive))
 
 
-def matches_keyword(text: str, keyword: str, case_sensitive: bool) -> bool:
-    if case_sensitive:
-        return keyword in text
-    return keyword.casefold() in text.casefold()
+def fold_case(value: str, case_sensitive: bool) -> str:
+    return value if case_sensitive else value.casefold()
 
 
-def matches_filename(pdf_path: Path, keyword: str, case_sensitive: bool) -> bool:
-    name = pdf_path.name
-    if case_sensitive:
-        return keyword in name
-    return keyword.casefold() in name.casefold()
+def match_content_keywords(
+    pdf_paths: Sequence[Path],
+    extracted_text: Dict[Path, str],
+    keywords: Sequence[str],
+    case_sensitive: bool,
+) -> Dict[str, List[Path]]:
+    # Fold every haystack and needle once instead of once per (keyword, PDF) pair.
+    folded_keywords = [fold_case(keyword, case_sensitive) for keyword in keywords]
+    folded_text = {
+        pdf_path: fold_case(extracted_text.get(pdf_path, ""), case_sensitive)
+        for pdf_path in pdf_paths
+    }
+
+    matched_by_keyword: Dict[str, List[Path]] = {keyword: [] for keyword in keywords}
+    if ahocorasick is None:
+        for keyword, folded_keyword in zip(keywords, folded_keywords):
+            matched_by_keyword[keyword] = [
+                pdf_path for pdf_path in pdf_paths if folded_keyword in folded_text[pdf_path]
+            ]
+        return matched_by_keyword
+
+    # One automaton finds every keyword in a single pass over each text.
+    # Keywords that only differ by case share one needle when case-insensitive.
+    # An empty keyword matches every text, as with the plain substring check; the
+    # automaton cannot hold an empty word, so handle it up front.
+    needles: Dict[str, List[str]] = {}
+    for keyword, folded_keyword in zip(keywords, folded_keywords):
+        if folded_keyword:
+            needles.setdefault(folded_keyword, []).append(keyword)
+        else:
+            matched_by_keyword[keyword] = list(pdf_paths)
+    if not needles:
+        return matched_by_keyword
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+
+    for pdf_path in pdf_paths:
+        found: Set[str] = set()
+        for _, needle in automaton.iter(folded_text[pdf_path]):
+            found.add(needle)
+            if len(found) == len(needles):
+                break
+        for needle in found:
+            for keyword in needles[needle]:
+                matched_by_keyword[keyword].append(pdf_path)
+    return matched_by_keyword
+
+
+@functools.lru_cache(maxsize=None)
+def keyword_pattern(folded_keywords: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(keyword) for keyword in folded_keywords))
+
+
+def match_filename_keywords(
+    pdf_paths: Sequence[Path], keywords: Sequence[str], case_sensitive: bool
+) -> Dict[str, List[Path]]:
+    folded_keywords = [fold_case(keyword, case_sensitive) for keyword in keywords]
+    folded_names = {pdf_path: fold_case(pdf_path.name, case_sensitive) for pdf_path in pdf_paths}
+
+    # One regex pass drops names that match no keyword. It only filters: an
+    # alternation reports one keyword per position, so overlapping keywords
+    # (e.g. "IC-21" and "IC-211") are still checked individually below.
+    pattern = keyword_pattern(tuple(folded_keywords))
+    candidates = [pdf_path for pdf_path in pdf_paths if pattern.search(folded_names[pdf_path])]
+
+    # One sweep over the candidates, checking each name against every keyword.
+    matched_by_keyword: Dict[str, List[Path]] = {keyword: [] for keyword in keywords}
+    keyword_pairs = list(zip(keywords, folded_keywords))
+    for pdf_path in candidates:
+        name = folded_names[pdf_path]
+        for keyword, folded_keyword in keyword_pairs:
+            if folded_keyword in name:
+                matched_by_keyword[keyword].append(pdf_path)
+    return matched_by_keyword
 
 
 def merge_pdfs_with_pypdf(pdf_paths: Sequence[Path], output_path: Path) -> bool:
@@ -215,20 +433,48 @@ def merge_pdfs_with_pypdf(pdf_paths: Sequence[Path], output_path: Path) -> bool:
         return False
     writer = PdfWriter()
     for pdf_path in pdf_paths:
-        reader = PdfReader(str(pdf_path))
-        for page in reader.pages:
-            writer.add_page(page)
+        writer.append(PdfReader(str(pdf_path)))
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("wb") as f:
+    # A large buffer coalesces pypdf's many small object writes into few syscalls.
+    with output_path.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
         writer.write(f)
     return True
 
 
-def run_gs_merge(pdf_paths: Sequence[Path], output_path: Path, extra_args: Sequence[str]) -> None:
+def write_gs_args_file(pdf_paths: Sequence[Path], directory: Path) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        suffix=".txt",
+        prefix="gs_args_",
+        dir=str(directory),
+        delete=False,
+        encoding="utf-8",
+    ) as tf:
+        for path in pdf_paths:
+            tf.write(f'"{path}"\n')
+    return Path(tf.name)
+
+
+def run_gs_merge(
+    pdf_paths: Sequence[Path],
+    output_path: Path,
+    tmp_dir: Path,
+    extra_args: Sequence[str],
+    on_start: Callable[[subprocess.Popen[str]], None] | None = None,
+) -> None:
     gs_path = shutil.which("gs")
     if not gs_path:
         raise RuntimeError("Ghostscript (gs) is required for PDF compression/merge fallback.")
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Pass inputs through an @response file so argv stays bounded for large merges.
+    # Paths that cannot be written as one quoted response-file entry go on argv.
+    args_path: Path | None = None
+    if any('"' in str(path) or "\n" in str(path) for path in pdf_paths):
+        inputs = [str(path) for path in pdf_paths]
+    else:
+        args_path = write_gs_args_file(pdf_paths, tmp_dir)
+        inputs = [f"@{args_path}"]
     cmd = [
         gs_path,
         "-q",
@@ -237,20 +483,31 @@ def run_gs_merge(pdf_paths: Sequence[Path], output_path: Path, extra_args: Seque
         "-sDEVICE=pdfwrite",
         *extra_args,
         f"-sOutputFile={output_path}",
-        *[str(path) for path in pdf_paths],
+        *inputs,
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"Ghostscript failed: {result.stderr.strip()}")
+    try:
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        ) as process:
+            if on_start is not None:
+                on_start(process)
+            _, stderr = process.communicate()
+    finally:
+        if args_path is not None:
+            args_path.unlink(missing_ok=True)
+    if process.returncode != 0:
+        raise RuntimeError(f"Ghostscript failed: {stderr.strip()}")
 
 
-def merge_pdfs(pdf_paths: Sequence[Path], output_path: Path) -> None:
+def merge_pdfs(pdf_paths: Sequence[Path], output_path: Path, tmp_dir: Path) -> None:
     if merge_pdfs_with_pypdf(pdf_paths, output_path):
         return
-    run_gs_merge(pdf_paths, output_path, extra_args=[])
+    run_gs_merge(pdf_paths, output_path, tmp_dir, extra_args=[])
 
 
-def enforce_size_limit(output_path: Path, limit_bytes: int, tmp_dir: Path) -> tuple[bool, int]:
+def enforce_size_limit(
+    output_path: Path, limit_bytes: int, tmp_dir: Path, workers: int = 1
+) -> tuple[bool, int]:
     original_size = output_path.stat().st_size
     if original_size <= limit_bytes:
         return True, original_size
@@ -268,48 +525,87 @@ def enforce_size_limit(output_path: Path, limit_bytes: int, tmp_dir: Path) -> tu
         ("ebook", 96),
         ("ebook", 72),
     ]
+    candidates = [
+        tmp_dir / f"compressed_{preset}_{dpi}_{output_path.name}" for preset, dpi in attempts
+    ]
 
-    smallest_path = output_path
-    smallest_size = original_size
-    chosen_path: Path | None = None
-    candidates: List[Path] = []
-
-    for preset, dpi in attempts:
-        candidate = tmp_dir / f"compressed_{preset}_{dpi}_{output_path.name}"
-        candidates.append(candidate)
-        extra_args = [
-            "-dCompatibilityLevel=1.4",
-            f"-dPDFSETTINGS=/{preset}",
-            "-dDetectDuplicateImages=true",
-            "-dCompressFonts=true",
-            "-dSubsetFonts=true",
-            "-dDownsampleColorImages=true",
-            "-dDownsampleGrayImages=true",
-            "-dDownsampleMonoImages=true",
-            f"-dColorImageResolution={dpi}",
-            f"-dGrayImageResolution={dpi}",
-            f"-dMonoImageResolution={dpi}",
-        ]
-        run_gs_merge([output_path], candidate, extra_args=extra_args)
-        size = candidate.stat().st_size
-
-        if size < smallest_size:
-            smallest_size = size
-            smallest_path = candidate
-        if size <= limit_bytes:
-            chosen_path = candidate
+    # Attempts run concurrently but are resolved in list order, as a sequential
+    # loop would: the earliest attempt that fits wins, and an attempt that fails
+    # only matters if no earlier attempt fits. Once attempt N fits or fails,
+    # attempts after N can no longer affect the result and are cancelled or killed.
+    lock = threading.Lock()
+    processes: Dict[int, subprocess.Popen[str]] = {}
+    cancelled: Set[int] = set()
+
+    def compress(index: int) -> int:
+        def register(process: subprocess.Popen[str]) -> None:
+            with lock:
+                processes[index] = process
+                if index in cancelled:
+                    process.kill()
+
+        preset, dpi = attempts[index]
+        run_gs_merge(
+            [output_path],
+            candidates[index],
+            tmp_dir,
+            extra_args=compression_args(preset, dpi),
+            on_start=register,
+        )
+        return candidates[index].stat().st_size
+
+    sizes: Dict[int, int] = {}
+    errors: Dict[int, Exception] = {}
+    # Each attempt is a gs process, so the pool is sized from the caller's worker budget.
+    with ThreadPoolExecutor(max_workers=max(1, min(len(attempts), workers))) as executor:
+        futures = {executor.submit(compress, index): index for index in range(len(attempts))}
+
+        def stop_after(index: int) -> None:
+            with lock:
+                for later_future, later in futures.items():
+                    if later > index and later not in cancelled:
+                        cancelled.add(later)
+                        later_future.cancel()
+                        if later in processes:
+                            processes[later].kill()
+
+        for future in as_completed(futures):
+            index = futures[future]
+            with lock:
+                if index in cancelled:
+                    continue
+            try:
+                size = future.result()
+            except Exception as exc:
+                errors[index] = exc
+                stop_after(index)
+                continue
+            sizes[index] = size
+            if size <= limit_bytes:
+                stop_after(index)
+
+    chosen_index: int | None = None
+    for index in range(len(attempts)):
+        if index in errors:
+            for candidate in candidates:
+                candidate.unlink(missing_ok=True)
+            raise errors[index]
+        if index in sizes and sizes[index] <= limit_bytes:
+            chosen_index = index
             break
 
-    if chosen_path is None:
-        if smallest_path != output_path:
-            shutil.move(str(smallest_path), str(output_path))
-        for candidate in candidates:
-            if candidate != smallest_path:
-                candidate.unlink(missing_ok=True)
-        final_size = output_path.stat().st_size
-        return final_size <= limit_bytes, final_size
+    if chosen_index is None:
+        chosen_path = output_path
+        smallest_size = original_size
+        for index, size in sorted(sizes.items()):
+            if size < smallest_size:
+                smallest_size = size
+                chosen_path = candidates[index]
+    else:
+        chosen_path = candidates[chosen_index]
 
-    shutil.move(str(chosen_path), str(output_path))
+    if chosen_path != output_path:
+        shutil.move(str(chosen_path), str(output_path))
     for candidate in candidates:
         if candidate != chosen_path:
             candidate.unlink(missing_ok=True)
@@ -317,6 +613,22 @@ def enforce_size_limit(output_path: Path, limit_bytes: int, tmp_dir: Path) -> tu
     return final_size <= limit_bytes, final_size
 
 
+def compression_args(preset: str, dpi: int) -> List[str]:
+    return [
+        "-dCompatibilityLevel=1.4",
+        f"-dPDFSETTINGS=/{preset}",
+        "-dDetectDuplicateImages=true",
+        "-dCompressFonts=true",
+        "-dSubsetFonts=true",
+        "-dDownsampleColorImages=true",
+        "-dDownsampleGrayImages=true",
+        "-dDownsampleMonoImages=true",
+        f"-dColorImageResolution={dpi}",
+        f"-dGrayImageResolution={dpi}",
+        f"-dMonoImageResolution={dpi}",
+    ]
+
+
 def indexed_output_path(base_output_path: Path, index: int) -> Path:
     return base_output_path.with_name(
         f"{base_output_path.stem}_{index:02d}{base_output_path.suffix}"
@@ -324,34 +636,103 @@ def indexed_output_path(base_output_path: Path, index: int) -> Path:
 
 
 def group_fits_size_limit(
-    group: Sequence[Path], limit_bytes: int, tmp_dir: Path, label: str
-) -> tuple[bool, int]:
+    group: Sequence[Path], limit_bytes: int, tmp_dir: Path, label: str, workers: int
+) -> tuple[bool, int, Path | None]:
     tmp_dir.mkdir(parents=True, exist_ok=True)
     probe = tmp_dir / f"fit_probe_{label}.pdf"
-    merge_pdfs(group, probe)
-    ok, size = enforce_size_limit(probe, limit_bytes, tmp_dir)
+    merge_pdfs(group, probe, tmp_dir)
+    ok, size = enforce_size_limit(probe, limit_bytes, tmp_dir, workers)
+    if ok:
+        # Keep a fitting probe: it is already the final merged, compressed output.
+        return ok, size, probe
     probe.unlink(missing_ok=True)
-    return ok, size
+    return ok, size, None
 
 
 def partition_groups_by_size(
-    group: Sequence[Path], limit_bytes: int, tmp_dir: Path, label: str
-) -> List[List[Path]]:
+    group: Sequence[Path],
+    limit_bytes: int,
+    tmp_dir: Path,
+    label: str,
+    workers: int,
+    probe_cache: Dict[tuple[Path, ...], tuple[bool, int, Path | None]] | None = None,
+) -> List[tuple[List[Path], Path | None]]:
+    # Each sub-group is returned with its fitting probe PDF, or None if unprobed.
     if not group:
         return []
-
-    ok, _ = group_fits_size_limit(group, limit_bytes, tmp_dir, label)
-    if ok:
-        return [list(group)]
+    # A single source is kept as-is whether or not it fits, so skip its probe.
     if len(group) == 1:
-        return [list(group)]
+        return [(list(group), None)]
+
+    if probe_cache is None:
+        probe_cache = {}
+    key = tuple(group)
+    if key not in probe_cache:
+        probe_cache[key] = group_fits_size_limit(group, limit_bytes, tmp_dir, label, workers)
+    ok, _, probe = probe_cache[key]
+    if ok:
+        return [(list(group), probe)]
 
     mid = len(group) // 2
-    left = partition_groups_by_size(group[:mid], limit_bytes, tmp_dir, f"{label}_L")
-    right = partition_groups_by_size(group[mid:], limit_bytes, tmp_dir, f"{label}_R")
+    left = partition_groups_by_size(
+        group[:mid], limit_bytes, tmp_dir, f"{label}_L", workers, probe_cache
+    )
+    right = partition_groups_by_size(
+        group[mid:], limit_bytes, tmp_dir, f"{label}_R", workers, probe_cache
+    )
     return left + right
 
 
+def _merge_and_enforce_worker(
+    group: List[str], output_path: str, limit_bytes: int, tmp_dir: str, workers: int
+) -> tuple[bool, int]:
+    merge_pdfs([Path(path) for path in group], Path(output_path), Path(tmp_dir))
+    return enforce_size_limit(Path(output_path), limit_bytes, Path(tmp_dir), workers)
+
+
+def write_split_outputs(
+    groups: Sequence[tuple[List[Path], Path | None]],
+    base_output_path: Path,
+    limit_bytes: int,
+    tmp_dir: Path,
+    workers: int,
+) -> List[tuple[bool, int]]:
+    results: Dict[int, tuple[bool, int]] = {}
+    pending: List[tuple[int, List[Path], Path]] = []
+    for index, (group, probe) in enumerate(groups):
+        indexed_path = indexed_output_path(base_output_path, index + 1)
+        if probe is not None:
+            indexed_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(probe), str(indexed_path))
+            results[index] = enforce_size_limit(indexed_path, limit_bytes, tmp_dir, workers)
+        else:
+            pending.append((index, group, indexed_path))
+
+    if workers <= 1 or len(pending) <= 1:
+        for index, group, indexed_path in pending:
+            merge_pdfs(group, indexed_path, tmp_dir)
+            results[index] = enforce_size_limit(indexed_path, limit_bytes, tmp_dir, workers)
+    else:
+        # Groups are independent, so merge and compress them in separate processes.
+        # The budget is shared out so split workers times gs attempts stays <= workers.
+        pool_size = min(workers, len(pending))
+        with ProcessPoolExecutor(max_workers=pool_size) as executor:
+            futures = {
+                executor.submit(
+                    _merge_and_enforce_worker,
+                    [str(path) for path in group],
+                    str(indexed_path),
+                    limit_bytes,
+                    str(tmp_dir),
+                    workers // pool_size,
+                ): index
+                for index, group, indexed_path in pending
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    return [results[index] for index in range(len(groups))]
+
+
 def main() -> int:
     args = parse_args()
 
@@ -366,6 +747,8 @@ def main() -> int:
         raise NotADirectoryError(f"Input directory not found: {input_dir}")
     if size_limit_bytes <= 0:
         raise ValueError("--size-limit-mb must be greater than 0")
+    if args.workers <= 0:
+        raise ValueError("--workers must be greater than 0")
 
     keywords = load_keywords(args)
     pdf_paths = list_pdfs(input_dir, recursive=not args.no_recursive)
@@ -374,29 +757,22 @@ def main() -> int:
 
     extracted_text: Dict[Path, str] = {}
     if args.match_mode == "content":
-        for pdf_path in pdf_paths:
-            try:
-                extracted_text[pdf_path] = extract_text(pdf_path, tmp_dir)
-            except Exception as exc:
-                print(f"[WARN] Failed to read {pdf_path}: {exc}")
-                extracted_text[pdf_path] = ""
+        extracted_text = extract_texts(
+            pdf_paths, tmp_dir, args.workers, use_cache=not args.no_cache
+        )
+
+    if args.match_mode == "filename":
+        keyword_matches = match_filename_keywords(pdf_paths, keywords, args.case_sensitive)
+    else:
+        keyword_matches = match_content_keywords(
+            pdf_paths, extracted_text, keywords, args.case_sensitive
+        )
 
     matched_by_keyword: Dict[str, List[Path]] = {}
     all_matches: Set[Path] = set()
 
     for keyword in keywords:
-        if args.match_mode == "filename":
-            matched = [
-                pdf_path
-                for pdf_path in pdf_paths
-                if matches_filename(pdf_path, keyword, args.case_sensitive)
-            ]
-        else:
-            matched = [
-                pdf_path
-                for pdf_path in pdf_paths
-                if matches_keyword(extracted_text.get(pdf_path, ""), keyword, args.case_sensitive)
-            ]
+        matched = keyword_matches[keyword]
         matched_by_keyword[keyword] = matched
         all_matches.update(matched)
         if not matched:
@@ -405,7 +781,8 @@ def main() -> int:
             print(f"[INFO] {keyword}: {len(matched)} matches")
 
     # Keep deterministic order by following sorted input list.
-    unique_merged_targets = [path for path in pdf_paths if path in all_matches]
+    path_index = {path: index for index, path in enumerate(pdf_paths)}
+    unique_merged_targets = sorted(all_matches, key=path_index.__getitem__)
 
     report = {
         "input_dir": str(input_dir),
@@ -433,8 +810,10 @@ def main() -> int:
             f"(limit: {size_limit_bytes} bytes)"
         )
     else:
-        merge_pdfs(unique_merged_targets, output_path)
-        within_limit, final_size = enforce_size_limit(output_path, size_limit_bytes, tmp_dir)
+        merge_pdfs(unique_merged_targets, output_path, tmp_dir)
+        within_limit, final_size = enforce_size_limit(
+            output_path, size_limit_bytes, tmp_dir, args.workers
+        )
 
         if within_limit:
             report["outputs"].append(
@@ -451,17 +830,27 @@ def main() -> int:
             )
         else:
             output_path.unlink(missing_ok=True)
+            # The full merge above already showed the root group does not fit.
+            probe_cache = {tuple(unique_merged_targets): (False, final_size, None)}
             groups = partition_groups_by_size(
-                unique_merged_targets, size_limit_bytes, tmp_dir, "root"
+                unique_merged_targets,
+                size_limit_bytes,
+                tmp_dir,
+                "root",
+                args.workers,
+                probe_cache,
             )
             print(
                 f"[INFO] Size limit exceeded. Split into {len(groups)} files with index suffix."
             )
 
-            for index, group in enumerate(groups, start=1):
+            split_results = write_split_outputs(
+                groups, output_path, size_limit_bytes, tmp_dir, args.workers
+            )
+            for index, ((group, _), (group_ok, group_size)) in enumerate(
+                zip(groups, split_results), start=1
+            ):
                 indexed_path = indexed_output_path(output_path, index)
-                merge_pdfs(group, indexed_path)
-                group_ok, group_size = enforce_size_limit(indexed_path, size_limit_bytes, tmp_dir)
                 report["outputs"].append(
                     {
                         "path": str(indexed_path),